@@ -13,20 +13,46 @@ Supports multiple authentication methods:
 import os
 import json
 import logging
+import functools
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Iterator, Tuple
 from enum import Enum
 
 import oci
-from flask import Flask, jsonify, request, send_from_directory
+from flask import (Flask, Response, abort, jsonify, make_response, request,
+                   send_from_directory, stream_with_context)
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from dateutil import parser as date_parser
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to Flask's stdlib-json provider
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, used for all API (de)serialization."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, default=str).decode()
+
+    def loads(self, s, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
 app = Flask(__name__, static_folder='static')
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 CORS(app)
 
 
@@ -112,6 +138,122 @@ def get_signer(auth_type: AuthType, config_file: str = "~/.oci/config",
         return config, None
 
 
+# Connection pool sizing for the OCI SDK's HTTPS sessions
+HTTP_POOL_CONNECTIONS = 32
+HTTP_POOL_MAXSIZE = 64
+
+
+def tune_http_session(sdk_client) -> None:
+    """
+    Enlarge an OCI SDK client's connection pool and ask for gzip responses.
+
+    The SDK's default pool keeps 10 connections, which is too small once
+    queries run concurrently. The replacement adapter is built from the class
+    the SDK already mounted so OCI-specific transport behaviour is preserved.
+    """
+    session = sdk_client.base_client.session
+    adapter_cls = type(session.get_adapter("https://"))
+    session.mount("https://", adapter_cls(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE
+    ))
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+
+
+# Lifetime of cached discovery results (compartments, namespaces, metrics, ...)
+CACHE_TTL_SECONDS = int(os.environ.get("OCI_CACHE_TTL", "300"))
+CACHE_MAX_ENTRIES = 512
+
+
+class TTLCache:
+    """
+    Small thread-safe in-process cache with per-entry expiry.
+
+    Used to avoid repeating paginated OCI list calls for data that rarely
+    changes between page loads.
+    """
+
+    def __init__(self, maxsize: int = CACHE_MAX_ENTRIES, ttl: float = CACHE_TTL_SECONDS):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[Any, tuple] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Return the cached value for key, or default if missing/expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key, value):
+        """Store value under key for ttl seconds."""
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                self._evict()
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self):
+        """Drop all cached entries."""
+        with self._lock:
+            self._data.clear()
+
+    def _evict(self):
+        """Drop expired entries, then the oldest one if still full."""
+        now = time.monotonic()
+        for key in [k for k, (expires_at, _) in self._data.items() if expires_at <= now]:
+            del self._data[key]
+        if len(self._data) >= self.maxsize:
+            del self._data[next(iter(self._data))]
+
+
+def cached_call(method):
+    """
+    Cache an OCIMonitoringClient method's result in the client's TTL cache.
+
+    The cache key includes tenancy and region so results never leak between
+    clients pointed at different regions.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, self.tenancy_id, self.config.get("region"),
+               args, tuple(sorted(kwargs.items())))
+        result = self._cache.get(key)
+        if result is None:
+            result = method(self, *args, **kwargs)
+            self._cache.set(key, result)
+        return result
+    return wrapper
+
+
+@dataclass
+class CompartmentEntry:
+    """A compartment with its full path (e.g. "tenancy/Prod/App")."""
+    __slots__ = ("id", "name", "path")
+    id: str
+    name: str
+    path: str
+
+
+@dataclass
+class MetricEntry:
+    """A metric definition with the union of its dimension keys."""
+    __slots__ = ("name", "namespace", "dimensions", "resource_group")
+    name: str
+    namespace: str
+    dimensions: List[str]
+    resource_group: Optional[str]
+
+
+# Upper bound on compartment nesting when resolving paths (OCI allows 6 levels)
+MAX_COMPARTMENT_DEPTH = 64
+
+
 class OCIMonitoringClient:
     """
     Client for interacting with OCI Monitoring service.
@@ -166,9 +308,22 @@ class OCIMonitoringClient:
             self.monitoring_client = oci.monitoring.MonitoringClient(self.config)
             self.identity_client = oci.identity.IdentityClient(self.config)
 
+        tune_http_session(self.monitoring_client)
+        tune_http_session(self.identity_client)
+
         # Get tenancy ID
         self.tenancy_id = self._get_tenancy_id()
 
+        # Cache for discovery calls (see cached_call)
+        self._cache = TTLCache()
+
+        # Tenancy details never change; fetched once on first use
+        self._tenancy = None
+
+    def cache_clear(self):
+        """Invalidate all cached discovery results for this client."""
+        self._cache.clear()
+
     def _get_tenancy_id(self) -> str:
         """
         Get the tenancy OCID based on authentication type.
@@ -209,7 +364,8 @@ class OCIMonitoringClient:
             "or ensure your authentication method provides tenancy information."
         )
 
-    def list_compartments(self, parent_compartment_id: Optional[str] = None) -> List[Dict]:
+    @cached_call
+    def list_compartments(self, parent_compartment_id: Optional[str] = None) -> List[CompartmentEntry]:
         """
         List all compartments accessible to the user.
 
@@ -220,12 +376,14 @@ class OCIMonitoringClient:
 
         try:
             # Get root compartment (tenancy)
-            tenancy = self.identity_client.get_tenancy(self.tenancy_id).data
-            compartments.append({
-                "id": self.tenancy_id,
-                "name": tenancy.name,
-                "path": f"{tenancy.name} (root)"
-            })
+            if self._tenancy is None:
+                self._tenancy = self.identity_client.get_tenancy(self.tenancy_id).data
+            tenancy = self._tenancy
+            compartments.append(CompartmentEntry(
+                id=self.tenancy_id,
+                name=tenancy.name,
+                path=f"{tenancy.name} (root)"
+            ))
 
             # List all sub-compartments recursively
             all_compartments = oci.pagination.list_call_get_all_results(
@@ -236,37 +394,54 @@ class OCIMonitoringClient:
                 lifecycle_state="ACTIVE"
             ).data
 
-            # Build compartment path map
-            compartment_map = {self.tenancy_id: tenancy.name}
-            for comp in all_compartments:
-                compartment_map[comp.id] = comp.name
-
-            # Build full paths
-            def get_path(comp_id, visited=None):
-                if visited is None:
-                    visited = set()
-                if comp_id in visited:
-                    return compartment_map.get(comp_id, "Unknown")
-                visited.add(comp_id)
-
-                comp = next((c for c in all_compartments if c.id == comp_id), None)
-                if comp is None or comp.compartment_id == self.tenancy_id:
-                    return f"{tenancy.name}/{compartment_map.get(comp_id, 'Unknown')}"
-                return f"{get_path(comp.compartment_id, visited)}/{comp.name}"
-
-            for comp in all_compartments:
-                compartments.append({
-                    "id": comp.id,
-                    "name": comp.name,
-                    "path": get_path(comp.id)
-                })
+            # Copy the fields we need into plain lists/dicts up front; SDK model
+            # attribute access is comparatively slow and the models are large
+            ids = [c.id for c in all_compartments]
+            names = {c.id: c.name for c in all_compartments}
+            parents = {c.id: c.compartment_id for c in all_compartments}
+            del all_compartments
+
+            # Memoize each resolved path so every ancestor chain is walked once
+            path_cache: Dict[str, str] = {self.tenancy_id: tenancy.name}
+
+            def path_of(comp_id: str) -> str:
+                stack = []
+                cid = comp_id
+                # OCI hierarchies are acyclic trees; the depth bound only
+                # protects against malformed data without a per-call set
+                for _ in range(MAX_COMPARTMENT_DEPTH):
+                    if cid in path_cache:
+                        base = path_cache[cid]
+                        break
+                    if cid not in parents:
+                        # Parent is not accessible: anchor it under the tenancy
+                        base = f"{tenancy.name}/Unknown"
+                        break
+                    stack.append(cid)
+                    cid = parents[cid]
+                else:
+                    logger.warning(f"Compartment hierarchy too deep or cyclic at {comp_id}")
+                    return names[comp_id]
+
+                for cid in reversed(stack):
+                    base = f"{base}/{names[cid]}"
+                    path_cache[cid] = base
+                return base
+
+            for comp_id in ids:
+                compartments.append(CompartmentEntry(
+                    id=comp_id,
+                    name=names[comp_id],
+                    path=path_of(comp_id)
+                ))
 
         except Exception as e:
             logger.error(f"Error listing compartments: {e}")
             raise
 
-        return sorted(compartments, key=lambda x: x["path"])
+        return sorted(compartments, key=lambda x: x.path)
 
+    @cached_call
     def list_metric_namespaces(self, compartment_id: str) -> List[str]:
         """
         List all metric namespaces available in a compartment.
@@ -278,24 +453,22 @@ class OCIMonitoringClient:
             List of namespace names
         """
         try:
-            namespaces = set()
-            response = oci.pagination.list_call_get_all_results(
-                self.monitoring_client.list_metrics,
+            records = oci.pagination.list_call_get_all_results_generator(
+                self.monitoring_client.list_metrics, 'record',
                 compartment_id=compartment_id,
                 list_metrics_details=oci.monitoring.models.ListMetricsDetails()
-            ).data
-
-            for metric in response:
-                namespaces.add(metric.namespace)
+            )
+            namespaces = {metric.namespace for metric in records}
 
-            return sorted(list(namespaces))
+            return sorted(namespaces)
 
         except Exception as e:
             logger.error(f"Error listing namespaces: {e}")
             raise
 
+    @cached_call
     def list_metrics(self, compartment_id: str, namespace: str,
-                     resource_group: Optional[str] = None) -> List[Dict]:
+                     resource_group: Optional[str] = None) -> List[MetricEntry]:
         """
         List all metrics within a namespace.
 
@@ -313,41 +486,37 @@ class OCIMonitoringClient:
                 resource_group=resource_group
             )
 
-            response = oci.pagination.list_call_get_all_results(
-                self.monitoring_client.list_metrics,
+            metrics: Dict[str, MetricEntry] = {}
+            records = oci.pagination.list_call_get_all_results_generator(
+                self.monitoring_client.list_metrics, 'record',
                 compartment_id=compartment_id,
                 list_metrics_details=details
-            ).data
-
-            metrics = {}
-            for metric in response:
-                if metric.name not in metrics:
-                    metrics[metric.name] = {
-                        "name": metric.name,
-                        "namespace": metric.namespace,
-                        "dimensions": set(),
-                        "resource_group": metric.resource_group
-                    }
+            )
+            for metric in records:
+                entry = metrics.get(metric.name)
+                if entry is None:
+                    # dimensions holds a set while accumulating
+                    entry = metrics[metric.name] = MetricEntry(
+                        name=metric.name,
+                        namespace=metric.namespace,
+                        dimensions=set(),
+                        resource_group=metric.resource_group
+                    )
                 # Collect all dimension keys
                 if metric.dimensions:
-                    metrics[metric.name]["dimensions"].update(metric.dimensions.keys())
-
-            # Convert sets to lists for JSON serialization
-            result = []
-            for name, data in metrics.items():
-                result.append({
-                    "name": data["name"],
-                    "namespace": data["namespace"],
-                    "dimensions": sorted(list(data["dimensions"])),
-                    "resource_group": data["resource_group"]
-                })
+                    entry.dimensions.update(metric.dimensions)
+
+            # Convert sets to sorted lists for JSON serialization
+            for entry in metrics.values():
+                entry.dimensions = sorted(entry.dimensions)
 
-            return sorted(result, key=lambda x: x["name"])
+            return sorted(metrics.values(), key=lambda x: x.name)
 
         except Exception as e:
             logger.error(f"Error listing metrics: {e}")
             raise
 
+    @cached_call
     def list_resource_groups(self, compartment_id: str, namespace: str) -> List[str]:
         """
         List all resource groups within a namespace.
@@ -365,23 +534,20 @@ class OCIMonitoringClient:
                 group_by=["resourceGroup"]
             )
 
-            response = oci.pagination.list_call_get_all_results(
-                self.monitoring_client.list_metrics,
+            records = oci.pagination.list_call_get_all_results_generator(
+                self.monitoring_client.list_metrics, 'record',
                 compartment_id=compartment_id,
                 list_metrics_details=details
-            ).data
-
-            groups = set()
-            for metric in response:
-                if metric.resource_group:
-                    groups.add(metric.resource_group)
+            )
+            groups = {metric.resource_group for metric in records if metric.resource_group}
 
-            return sorted(list(groups))
+            return sorted(groups)
 
         except Exception as e:
             logger.error(f"Error listing resource groups: {e}")
             raise
 
+    @cached_call
     def list_dimensions(self, compartment_id: str, namespace: str,
                         metric_name: Optional[str] = None) -> Dict[str, List[str]]:
         """
@@ -401,22 +567,19 @@ class OCIMonitoringClient:
                 name=metric_name
             )
 
-            response = oci.pagination.list_call_get_all_results(
-                self.monitoring_client.list_metrics,
+            dimensions: Dict[str, set] = {}
+            records = oci.pagination.list_call_get_all_results_generator(
+                self.monitoring_client.list_metrics, 'record',
                 compartment_id=compartment_id,
                 list_metrics_details=details
-            ).data
-
-            dimensions: Dict[str, set] = {}
-            for metric in response:
+            )
+            for metric in records:
                 if metric.dimensions:
                     for key, value in metric.dimensions.items():
-                        if key not in dimensions:
-                            dimensions[key] = set()
-                        dimensions[key].add(value)
+                        dimensions.setdefault(key, set()).add(value)
 
             # Convert sets to sorted lists
-            return {k: sorted(list(v)) for k, v in sorted(dimensions.items())}
+            return {k: sorted(v) for k, v in sorted(dimensions.items())}
 
         except Exception as e:
             logger.error(f"Error listing dimensions: {e}")
@@ -447,28 +610,31 @@ class OCIMonitoringClient:
                 dimension_filters=dimension_filters if dimension_filters else None
             )
 
-            response = oci.pagination.list_call_get_all_results(
-                self.monitoring_client.list_metrics,
+            records = oci.pagination.list_call_get_all_results_generator(
+                self.monitoring_client.list_metrics, 'record',
                 compartment_id=compartment_id,
                 list_metrics_details=details
-            ).data
-
-            values = set()
-            for metric in response:
-                if metric.dimensions and dimension_name in metric.dimensions:
-                    values.add(metric.dimensions[dimension_name])
+            )
+            values = {
+                metric.dimensions[dimension_name]
+                for metric in records
+                if metric.dimensions and dimension_name in metric.dimensions
+            }
 
-            return sorted(list(values))
+            return sorted(values)
 
         except Exception as e:
             logger.error(f"Error listing dimension values: {e}")
             raise
 
-    def query_metrics(self, compartment_id: str, namespace: str, query: str,
-                      start_time: datetime, end_time: datetime,
-                      resolution: Optional[str] = None) -> Dict[str, Any]:
+    def iter_query_metrics(self, compartment_id: str, namespace: str, query: str,
+                           start_time: datetime, end_time: datetime,
+                           resolution: Optional[str] = None) -> Tuple[Dict[str, Any], Iterator[Dict]]:
         """
-        Query metric data using MQL.
+        Query metric data using MQL, building series lazily.
+
+        The OCI call is made up front so errors surface before iteration
+        starts; each series dict is only built when the iterator reaches it.
 
         Args:
             compartment_id: The OCID of the compartment
@@ -479,7 +645,7 @@ class OCIMonitoringClient:
             resolution: Optional resolution for data points
 
         Returns:
-            Dict containing metric data with timestamps and values
+            Tuple of (result header dict without metric_data, iterator of series dicts)
         """
         try:
             details = oci.monitoring.models.SummarizeMetricsDataDetails(
@@ -495,64 +661,108 @@ class OCIMonitoringClient:
                 summarize_metrics_data_details=details
             ).data
 
-            result = {
-                "query": query,
-                "namespace": namespace,
-                "start_time": start_time.isoformat(),
-                "end_time": end_time.isoformat(),
-                "metric_data": []
-            }
+        except Exception as e:
+            logger.error(f"Error querying metrics: {e}")
+            raise
 
-            for metric_data in response:
-                # Build a label from dimensions
-                label_parts = [metric_data.name]
-                if metric_data.dimensions:
+        header = {
+            "query": query,
+            "namespace": namespace,
+            "start_time": start_time.isoformat(),
+            "end_time": end_time.isoformat()
+        }
+        return header, self._iter_series(response)
+
+    @staticmethod
+    def _iter_series(response) -> Iterator[Dict]:
+        """Convert summarize_metrics_data results into series dicts."""
+        # Dimension label strings, reused across series sharing dimensions
+        label_cache: Dict[frozenset, str] = {}
+
+        # Series of one query share a timestamp grid, so each distinct
+        # timestamp is formatted once and reused
+        timestamp_strings: Dict[datetime, str] = {}
+
+        def iso(ts: datetime) -> str:
+            value = timestamp_strings.get(ts)
+            if value is None:
+                value = timestamp_strings[ts] = ts.isoformat()
+            return value
+
+        for metric_data in response:
+            # Build a label from dimensions
+            label_parts = [metric_data.name]
+            if metric_data.dimensions:
+                key = frozenset(metric_data.dimensions.items())
+                dim_str = label_cache.get(key)
+                if dim_str is None:
                     dim_str = ", ".join([f"{k}={v}" for k, v in sorted(metric_data.dimensions.items())])
-                    label_parts.append(f"({dim_str})")
-
-                series = {
-                    "name": metric_data.name,
-                    "namespace": metric_data.namespace,
-                    "dimensions": metric_data.dimensions or {},
-                    "label": " ".join(label_parts),
-                    "unit": metric_data.metadata.get("unit", "") if metric_data.metadata else "",
-                    "data_points": []
-                }
-
-                for point in metric_data.aggregated_datapoints:
-                    series["data_points"].append({
-                        "timestamp": point.timestamp.isoformat(),
-                        "value": point.value
-                    })
+                    label_cache[key] = dim_str
+                label_parts.append(f"({dim_str})")
+
+            yield {
+                "name": metric_data.name,
+                "namespace": metric_data.namespace,
+                "dimensions": metric_data.dimensions or {},
+                "label": " ".join(label_parts),
+                "unit": metric_data.metadata.get("unit", "") if metric_data.metadata else "",
+                # Built in a single comprehension: this is the hot loop
+                # for long time ranges at fine resolution
+                "data_points": [
+                    {"timestamp": iso(point.timestamp), "value": point.value}
+                    for point in metric_data.aggregated_datapoints
+                ]
+            }
 
-                result["metric_data"].append(series)
+    def query_metrics(self, compartment_id: str, namespace: str, query: str,
+                      start_time: datetime, end_time: datetime,
+                      resolution: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Query metric data using MQL.
 
-            return result
+        Args:
+            compartment_id: The OCID of the compartment
+            namespace: The metric namespace
+            query: MQL query string
+            start_time: Query start time
+            end_time: Query end time
+            resolution: Optional resolution for data points
 
-        except Exception as e:
-            logger.error(f"Error querying metrics: {e}")
-            raise
+        Returns:
+            Dict containing metric data with timestamps and values
+        """
+        result, series = self.iter_query_metrics(
+            compartment_id, namespace, query, start_time, end_time, resolution
+        )
+        result["metric_data"] = list(series)
+        return result
 
 
-# Global OCI client instance (kept for backward compatibility)
-oci_client = None
+# Worker pool for running independent metric queries concurrently
+# (threads are only started on first use)
+QUERY_WORKERS = int(os.environ.get("OCI_QUERY_WORKERS", "8"))
+_query_executor = ThreadPoolExecutor(max_workers=QUERY_WORKERS, thread_name_prefix="oci-query")
 
 # Compartment name cache for result labeling
-_compartment_cache: Dict[str, Dict] = {}
+_compartment_cache: Dict[str, CompartmentEntry] = {}
 
 
 def get_compartment_name(compartment_id: str) -> str:
     """Get compartment name from cache."""
     if compartment_id in _compartment_cache:
-        return _compartment_cache[compartment_id].get('name', compartment_id)
+        return _compartment_cache[compartment_id].name
     return compartment_id
 
 
-def populate_compartment_cache(compartments: List[Dict]):
+def populate_compartment_cache(compartments: List[CompartmentEntry]):
     """Populate compartment cache from API response."""
     global _compartment_cache
     for comp in compartments:
-        _compartment_cache[comp['id']] = comp
+        _compartment_cache[comp.id] = comp
+
+
+# Shape of OCI region identifiers, e.g. us-ashburn-1 or us-gov-phoenix-1
+_REGION_PATTERN = re.compile(r"[a-z]+(?:-[a-z]+)+-\d+")
 
 
 class OCIRegionClientManager:
@@ -563,33 +773,103 @@ class OCIRegionClientManager:
     """
 
     def __init__(self, config_file: str = "~/.oci/config", profile: str = "DEFAULT",
-                 auth_type: AuthType = None):
+                 auth_type: AuthType = None, default_region: str = None):
         self.config_file = config_file
         self.profile = profile
         self.auth_type = auth_type or detect_auth_type()
         self._clients: Dict[str, OCIMonitoringClient] = {}
+        self._lock = threading.Lock()
         self._base_config, self._signer = get_signer(self.auth_type, config_file, profile)
-        self._default_region = self._base_config.get("region", "us-ashburn-1")
+        self._default_region = default_region or self._base_config.get("region", "us-ashburn-1")
         self._tenancy_id = self._base_config.get("tenancy")
+        self._regions: Optional[List[str]] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def is_known_region(self, region: str) -> bool:
+        """Whether region is the default region or one the tenancy is subscribed to."""
+        return region == self._default_region or (
+            _REGION_PATTERN.fullmatch(region) is not None
+            and region in self.get_available_regions()
+        )
 
     def get_client(self, region: str = None) -> OCIMonitoringClient:
-        """Get or create a client for a specific region."""
+        """
+        Get or create a client for a specific region.
+
+        Raises:
+            ValueError: If region is not a subscribed region; clients are cached
+                for the life of the process, so only real regions get one
+        """
         region = region or self._default_region
-        if region not in self._clients:
-            self._clients[region] = OCIMonitoringClient(
-                config_file=self.config_file,
-                profile=self.profile,
-                auth_type=self.auth_type,
-                region=region
-            )
-        return self._clients[region]
+        client = self._clients.get(region)
+        if client is None:
+            if not self.is_known_region(region):
+                raise ValueError(f"Unknown or unsubscribed region: {region}")
+            with self._lock:
+                client = self._clients.get(region)
+                if client is None:
+                    client = OCIMonitoringClient(
+                        config_file=self.config_file,
+                        profile=self.profile,
+                        auth_type=self.auth_type,
+                        region=region
+                    )
+                    self._clients[region] = client
+        return client
+
+    def map_regions(self, fn: Callable[[OCIMonitoringClient], Any],
+                    regions: Optional[List[str]] = None,
+                    max_workers: int = 8) -> Dict[str, Any]:
+        """
+        Run fn(client) against several regions concurrently.
+
+        OCI calls are blocking HTTPS round-trips, so fanning out on a thread
+        pool makes the total latency that of the slowest region rather than
+        the sum of all of them.
+
+        Args:
+            fn: Callable receiving the region's OCIMonitoringClient
+            regions: Regions to run against (defaults to the default region)
+            max_workers: Thread pool size (applied when the pool is created)
+
+        Returns:
+            Dict mapping each region to fn's result, or to the exception raised
+            while creating the client or running fn
+        """
+        regions = regions or [self._default_region]
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="oci-region"
+                )
+
+        results: Dict[str, Any] = {}
+        futures = {}
+        for region in regions:
+            try:
+                client = self.get_client(region)
+            except Exception as e:
+                results[region] = e
+                continue
+            futures[region] = self._executor.submit(fn, client)
+
+        for region, future in futures.items():
+            try:
+                results[region] = future.result()
+            except Exception as e:
+                results[region] = e
+
+        return {region: results[region] for region in regions}
 
     def get_default_region(self) -> str:
         """Get the default region from config."""
         return self._default_region
 
     def get_available_regions(self) -> List[str]:
-        """Get list of subscribed OCI regions."""
+        """Get list of subscribed OCI regions (memoized per manager)."""
+        if self._regions is not None:
+            return self._regions
+
         try:
             # Use identity client to list subscribed regions
             if self._signer:
@@ -603,71 +883,100 @@ class OCIRegionClientManager:
                 tenancy_id=self._tenancy_id
             ).data
 
-            return sorted([r.region_name for r in regions if r.status == "READY"])
+            self._regions = sorted([r.region_name for r in regions if r.status == "READY"])
+            return self._regions
         except Exception as e:
             logger.error(f"Error listing regions: {e}")
             # Return default region as fallback
             return [self._default_region]
 
+    def cache_clear(self):
+        """Invalidate memoized regions and cached results of all region clients."""
+        self._regions = None
+        for client in list(self._clients.values()):
+            client.cache_clear()
+
 
-# Global region client manager
+# Global region client manager (the single factory for OCI clients)
 _region_manager = None
+_client_init_lock = threading.Lock()
+
+
+def get_auth_type_from_env() -> Optional[AuthType]:
+    """Read an explicit auth type override from OCI_AUTH_TYPE (None = auto-detect)."""
+    auth_type_str = os.environ.get("OCI_AUTH_TYPE", "").lower()
+    try:
+        return AuthType(auth_type_str) if auth_type_str else None
+    except ValueError:
+        return None
 
 
 def get_region_manager() -> OCIRegionClientManager:
     """Get or create the region client manager."""
     global _region_manager
     if _region_manager is None:
-        config_file = os.environ.get("OCI_CONFIG_FILE", "~/.oci/config")
-        profile = os.environ.get("OCI_CONFIG_PROFILE", "DEFAULT")
-
-        auth_type_str = os.environ.get("OCI_AUTH_TYPE", "").lower()
-        auth_type = None
-        if auth_type_str == "instance_principal":
-            auth_type = AuthType.INSTANCE_PRINCIPAL
-        elif auth_type_str == "resource_principal":
-            auth_type = AuthType.RESOURCE_PRINCIPAL
-        elif auth_type_str == "security_token":
-            auth_type = AuthType.SECURITY_TOKEN
-        elif auth_type_str == "config_file":
-            auth_type = AuthType.CONFIG_FILE
-
-        _region_manager = OCIRegionClientManager(
-            config_file=config_file,
-            profile=profile,
-            auth_type=auth_type
-        )
+        with _client_init_lock:
+            if _region_manager is None:
+                _region_manager = OCIRegionClientManager(
+                    config_file=os.environ.get("OCI_CONFIG_FILE", "~/.oci/config"),
+                    profile=os.environ.get("OCI_CONFIG_PROFILE", "DEFAULT"),
+                    auth_type=get_auth_type_from_env(),
+                    default_region=os.environ.get("OCI_REGION")
+                )
     return _region_manager
 
 
-def get_oci_client() -> OCIMonitoringClient:
-    """Get or create the OCI client instance."""
-    global oci_client
-    if oci_client is None:
-        config_file = os.environ.get("OCI_CONFIG_FILE", "~/.oci/config")
-        profile = os.environ.get("OCI_CONFIG_PROFILE", "DEFAULT")
-        region = os.environ.get("OCI_REGION")
-
-        # Check for explicit auth type override
-        auth_type_str = os.environ.get("OCI_AUTH_TYPE", "").lower()
-        auth_type = None
-        if auth_type_str == "instance_principal":
-            auth_type = AuthType.INSTANCE_PRINCIPAL
-        elif auth_type_str == "resource_principal":
-            auth_type = AuthType.RESOURCE_PRINCIPAL
-        elif auth_type_str == "security_token":
-            auth_type = AuthType.SECURITY_TOKEN
-        elif auth_type_str == "config_file":
-            auth_type = AuthType.CONFIG_FILE
-        # Otherwise auto-detect
-
-        oci_client = OCIMonitoringClient(
-            config_file=config_file,
-            profile=profile,
-            auth_type=auth_type,
-            region=region
-        )
-    return oci_client
+def get_oci_client(region: Optional[str] = None) -> OCIMonitoringClient:
+    """Get the OCI client for a region (defaults to the configured region)."""
+    return get_region_manager().get_client(region)
+
+
+def warm_up_clients():
+    """Build the default-region client in the background so the first request is fast."""
+    def warm():
+        try:
+            get_oci_client()
+            logger.info("OCI client warm-up complete")
+        except Exception as e:
+            logger.warning(f"OCI client warm-up failed: {e}")
+
+    threading.Thread(target=warm, name="oci-warmup", daemon=True).start()
+
+
+def require_args(*names: str) -> tuple:
+    """
+    Read required query args in one pass, aborting with 400 if any are missing.
+
+    Returns:
+        Tuple of the arg values, in the order requested
+    """
+    args = request.args
+    values = tuple(args.get(name) for name in names)
+    missing = [name for name, value in zip(names, values) if not value]
+    if missing:
+        if len(missing) == 1:
+            message = f"{missing[0]} is required"
+        else:
+            message = f"{', '.join(missing[:-1])} and {missing[-1]} are required"
+        abort(make_response(jsonify({"error": message}), 400))
+    return values
+
+
+def require_known_region(region: Optional[str]) -> Optional[str]:
+    """
+    Abort with 400 if a requested region is not one the tenancy subscribes to.
+
+    Returns:
+        The region, unchanged (None means the default region)
+    """
+    if region:
+        try:
+            known = get_region_manager().is_known_region(region)
+        except Exception:
+            return region  # Client setup errors are reported by the route itself
+        if not known:
+            abort(make_response(jsonify({"error": f"Unknown region: {region}"}), 400))
+    return region
 
 
 # API Routes
@@ -678,11 +987,19 @@ def index():
     return send_from_directory('static', 'index.html')
 
 
+@app.route('/healthz', methods=['GET'])
+def healthz():
+    """Liveness probe; deliberately does not touch OCI."""
+    return jsonify({"ok": True})
+
+
 @app.route('/api/auth-info', methods=['GET'])
 def api_auth_info():
     """Get current authentication information."""
+    region = require_known_region(request.args.get('region'))
+
     try:
-        client = get_oci_client()
+        client = get_oci_client(region)
         return jsonify({
             "auth_type": client.auth_type.value,
             "tenancy_id": client.tenancy_id,
@@ -696,8 +1013,10 @@ def api_auth_info():
 @app.route('/api/compartments', methods=['GET'])
 def api_list_compartments():
     """List all accessible compartments."""
+    region = require_known_region(request.args.get('region'))
+
     try:
-        client = get_oci_client()
+        client = get_oci_client(region)
         compartments = client.list_compartments()
         # Populate compartment cache for result labeling
         populate_compartment_cache(compartments)
@@ -722,15 +1041,23 @@ def api_list_regions():
         return jsonify({"error": str(e)}), 500
 
 
+@app.route('/api/cache/invalidate', methods=['POST'])
+def api_invalidate_cache():
+    """Drop cached compartments, namespaces, metrics and regions."""
+    if _region_manager is not None:
+        _region_manager.cache_clear()
+    return jsonify({"status": "ok"})
+
+
 @app.route('/api/namespaces', methods=['GET'])
 def api_list_namespaces():
     """List metric namespaces in a compartment."""
-    compartment_id = request.args.get('compartment_id')
-    if not compartment_id:
-        return jsonify({"error": "compartment_id is required"}), 400
+    (compartment_id,) = require_args('compartment_id')
+
+    region = require_known_region(request.args.get('region'))
 
     try:
-        client = get_oci_client()
+        client = get_oci_client(region)
         namespaces = client.list_metric_namespaces(compartment_id)
         return jsonify({"namespaces": namespaces})
     except Exception as e:
@@ -741,14 +1068,12 @@ def api_list_namespaces():
 @app.route('/api/resource-groups', methods=['GET'])
 def api_list_resource_groups():
     """List resource groups in a namespace."""
-    compartment_id = request.args.get('compartment_id')
-    namespace = request.args.get('namespace')
+    compartment_id, namespace = require_args('compartment_id', 'namespace')
 
-    if not compartment_id or not namespace:
-        return jsonify({"error": "compartment_id and namespace are required"}), 400
+    region = require_known_region(request.args.get('region'))
 
     try:
-        client = get_oci_client()
+        client = get_oci_client(region)
         groups = client.list_resource_groups(compartment_id, namespace)
         return jsonify({"resource_groups": groups})
     except Exception as e:
@@ -759,15 +1084,13 @@ def api_list_resource_groups():
 @app.route('/api/metrics', methods=['GET'])
 def api_list_metrics():
     """List metrics in a namespace."""
-    compartment_id = request.args.get('compartment_id')
-    namespace = request.args.get('namespace')
+    compartment_id, namespace = require_args('compartment_id', 'namespace')
     resource_group = request.args.get('resource_group')
 
-    if not compartment_id or not namespace:
-        return jsonify({"error": "compartment_id and namespace are required"}), 400
+    region = require_known_region(request.args.get('region'))
 
     try:
-        client = get_oci_client()
+        client = get_oci_client(region)
         metrics = client.list_metrics(compartment_id, namespace, resource_group)
         return jsonify({"metrics": metrics})
     except Exception as e:
@@ -778,15 +1101,13 @@ def api_list_metrics():
 @app.route('/api/dimensions', methods=['GET'])
 def api_list_dimensions():
     """List all dimensions and their values for a namespace/metric."""
-    compartment_id = request.args.get('compartment_id')
-    namespace = request.args.get('namespace')
+    compartment_id, namespace = require_args('compartment_id', 'namespace')
     metric_name = request.args.get('metric_name')
 
-    if not compartment_id or not namespace:
-        return jsonify({"error": "compartment_id and namespace are required"}), 400
+    region = require_known_region(request.args.get('region'))
 
     try:
-        client = get_oci_client()
+        client = get_oci_client(region)
         dimensions = client.list_dimensions(compartment_id, namespace, metric_name)
         return jsonify({"dimensions": dimensions})
     except Exception as e:
@@ -794,29 +1115,33 @@ def api_list_dimensions():
         return jsonify({"error": str(e)}), 500
 
 
+# Query args of the form filter_<dimension>=<value> narrow dimension value lookups
+_FILTER_PREFIX = 'filter_'
+_FILTER_PREFIX_LEN = len(_FILTER_PREFIX)
+
+
 @app.route('/api/dimension-values', methods=['GET'])
 def api_list_dimension_values():
     """List values for a specific dimension."""
-    compartment_id = request.args.get('compartment_id')
-    namespace = request.args.get('namespace')
-    dimension_name = request.args.get('dimension_name')
+    compartment_id, namespace, dimension_name = require_args(
+        'compartment_id', 'namespace', 'dimension_name'
+    )
     metric_name = request.args.get('metric_name')
 
-    if not compartment_id or not namespace or not dimension_name:
-        return jsonify({"error": "compartment_id, namespace, and dimension_name are required"}), 400
+    # Parse any filter parameters (filter_<dimension>=value)
+    filters = {
+        key[_FILTER_PREFIX_LEN:]: value
+        for key, value in request.args.items()
+        if key.startswith(_FILTER_PREFIX)
+    }
 
-    # Parse any filter parameters (dimension_filter_xxx=value)
-    filters = {}
-    for key, value in request.args.items():
-        if key.startswith('filter_'):
-            dim_name = key[7:]  # Remove 'filter_' prefix
-            filters[dim_name] = value
+    region = require_known_region(request.args.get('region'))
 
     try:
-        client = get_oci_client()
+        client = get_oci_client(region)
         values = client.list_dimension_values(
             compartment_id, namespace, dimension_name,
-            metric_name=metric_name, filters=filters if filters else None
+            metric_name=metric_name, filters=filters or None
         )
         return jsonify({"values": values})
     except Exception as e:
@@ -840,9 +1165,11 @@ def api_query_metrics():
     except Exception as e:
         return jsonify({"error": f"Invalid date format: {e}"}), 400
 
+    region = require_known_region(data.get('region'))
+
     try:
-        client = get_oci_client()
-        result = client.query_metrics(
+        client = get_oci_client(region)
+        header, series_iter = client.iter_query_metrics(
             compartment_id=data['compartment_id'],
             namespace=data['namespace'],
             query=data['query'],
@@ -850,11 +1177,21 @@ def api_query_metrics():
             end_time=end_time,
             resolution=data.get('resolution')
         )
-        return jsonify(result)
     except Exception as e:
         logger.error(f"API error querying metrics: {e}")
         return jsonify({"error": str(e)}), 500
 
+    def generate():
+        # Same document as query_metrics() returns, emitted one series at a time
+        yield app.json.dumps(header)[:-1] + ',"metric_data":['
+        for idx, series in enumerate(series_iter):
+            if idx:
+                yield ','
+            yield app.json.dumps(series)
+        yield ']}'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
 
 @app.route('/api/query-multiple', methods=['POST'])
 def api_query_multiple():
@@ -868,35 +1205,45 @@ def api_query_multiple():
     results = []
     errors = []
 
-    client = get_oci_client()
+    client = get_oci_client(require_known_region(data.get('region')))
+
+    def run_query(idx: int, query_def: Dict) -> Dict:
+        start_time = date_parser.parse(query_def['start_time'])
+        end_time = date_parser.parse(query_def['end_time'])
 
+        result = client.query_metrics(
+            compartment_id=query_def['compartment_id'],
+            namespace=query_def['namespace'],
+            query=query_def['query'],
+            start_time=start_time,
+            end_time=end_time,
+            resolution=query_def.get('resolution')
+        )
+        result['query_id'] = query_def.get('id', idx)
+        result['query_name'] = query_def.get('name', f"Query {idx + 1}")
+        return result
+
+    # Submit every well-formed query up front so they run concurrently
+    required_fields = ['compartment_id', 'namespace', 'query', 'start_time', 'end_time']
+    pending = []
     for idx, query_def in enumerate(queries):
-        required_fields = ['compartment_id', 'namespace', 'query', 'start_time', 'end_time']
         missing = [f for f in required_fields if f not in query_def]
-
         if missing:
+            pending.append((idx, query_def, f"Missing fields: {', '.join(missing)}"))
+        else:
+            pending.append((idx, query_def, _query_executor.submit(run_query, idx, query_def)))
+
+    # Collect in request order
+    for idx, query_def, outcome in pending:
+        if isinstance(outcome, str):
             errors.append({
                 "query_index": idx,
-                "error": f"Missing fields: {', '.join(missing)}"
+                "error": outcome
             })
             continue
 
         try:
-            start_time = date_parser.parse(query_def['start_time'])
-            end_time = date_parser.parse(query_def['end_time'])
-
-            result = client.query_metrics(
-                compartment_id=query_def['compartment_id'],
-                namespace=query_def['namespace'],
-                query=query_def['query'],
-                start_time=start_time,
-                end_time=end_time,
-                resolution=query_def.get('resolution')
-            )
-            result['query_id'] = query_def.get('id', idx)
-            result['query_name'] = query_def.get('name', f"Query {idx + 1}")
-            results.append(result)
-
+            results.append(outcome.result())
         except Exception as e:
             errors.append({
                 "query_index": idx,
@@ -944,8 +1291,8 @@ def api_query_unified():
     # Get regions - default to current region if not specified
     manager = get_region_manager()
     regions = data.get('regions', [])
-    # Filter out empty/None values and fallback to default if no valid regions
-    regions = [r for r in regions if r]
+    # Filter out empty/None/duplicate values and fallback to default if no valid regions
+    regions = list(dict.fromkeys(r for r in regions if r))
     if not regions:
         regions = [manager.get_default_region()]
 
@@ -965,19 +1312,11 @@ def api_query_unified():
     logger.info(f"Unified query: {len(regions)} regions x {len(compartment_ids)} compartments = {len(regions) * len(compartment_ids)} queries")
     logger.info(f"Regions: {regions}")
 
-    # Query each region/compartment combination
-    for region in regions:
-        try:
-            client = manager.get_client(region)
-        except Exception as e:
-            # Region not available
-            for comp_id in compartment_ids:
-                errors.append({
-                    "region": region,
-                    "compartment_id": comp_id,
-                    "error": f"Failed to connect to region {region}: {str(e)}"
-                })
-            continue
+    def query_region(client: OCIMonitoringClient) -> tuple:
+        """Run the query for every compartment in one region."""
+        region = client.config.get("region")
+        region_results = []
+        region_errors = []
 
         for compartment_id in compartment_ids:
             try:
@@ -1008,7 +1347,7 @@ def api_query_unified():
                 metric_count = len(result.get('metric_data', []))
                 logger.info(f"Region {region}, compartment {compartment_name}: {metric_count} metric series")
 
-                results.append({
+                region_results.append({
                     'region': region,
                     'compartment_id': compartment_id,
                     'compartment_name': compartment_name,
@@ -1017,13 +1356,31 @@ def api_query_unified():
 
             except Exception as e:
                 logger.error(f"Error querying {region}/{compartment_id}: {e}")
-                errors.append({
+                region_errors.append({
                     "region": region,
                     "compartment_id": compartment_id,
                     "compartment_name": get_compartment_name(compartment_id),
                     "error": str(e)
                 })
 
+        return region_results, region_errors
+
+    # Query all regions concurrently; each region walks its compartments
+    for region, outcome in manager.map_regions(query_region, regions).items():
+        if isinstance(outcome, Exception):
+            # Region not available
+            for comp_id in compartment_ids:
+                errors.append({
+                    "region": region,
+                    "compartment_id": comp_id,
+                    "error": f"Failed to connect to region {region}: {str(outcome)}"
+                })
+            continue
+
+        region_results, region_errors = outcome
+        results.extend(region_results)
+        errors.extend(region_errors)
+
     return jsonify({
         "results": results,
         "errors": errors,
@@ -1107,4 +1464,5 @@ def api_query_options():
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 8080))
     debug = os.environ.get('FLASK_DEBUG', 'false').lower() == 'true'
+    warm_up_clients()
     app.run(host='0.0.0.0', port=port, debug=debug)
@@ -32,24 +32,51 @@ Examples:
 """
 
 import argparse
+import functools
+import gzip
+import hashlib
+import html
 import json
 import os
 import sys
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, BinaryIO, Iterable, Iterator, TextIO
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from app import OCIMonitoringClient, AuthType, detect_auth_type
+# app (and with it the OCI SDK) is imported lazily in main(), so --help and
+# argument errors don't pay the SDK import cost
+if TYPE_CHECKING:
+    from app import AuthType
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
 
-def parse_args():
-    """Parse command line arguments."""
-    parser = argparse.ArgumentParser(
-        description="Generate OCI Monitoring metrics report as HTML",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+# Upper bound on concurrent OCI Monitoring queries
+MAX_QUERY_WORKERS = 16
+
+# On-disk cache of query results, so re-running a report (e.g. to tweak the
+# title) doesn't hit the Monitoring API again
+CACHE_DIR = os.path.expanduser(os.environ.get("OCI_METRICS_CACHE_DIR", "~/.oci_metrics_cache"))
+
+# Chart series colors (line and translucent fill), cycled per series
+_BASE_COLORS = (
+    (49, 45, 42), (40, 167, 69), (220, 53, 69), (255, 193, 7),
+    (111, 66, 193), (23, 162, 184), (253, 126, 20), (108, 117, 125),
+)
+_COLORS_SOLID = tuple(f"rgba({r}, {g}, {b}, 1.0)" for r, g, b in _BASE_COLORS)
+_COLORS_FILL = tuple(f"rgba({r}, {g}, {b}, 0.1)" for r, g, b in _BASE_COLORS)
+
+
+_DESCRIPTION = "Generate OCI Monitoring metrics report as HTML"
+
+_EPILOG = """
 Authentication Methods:
   --auth config_file        Use OCI config file (default)
   --auth instance_principal Use instance principal (CloudShell, compute instances)
@@ -70,13 +97,35 @@ Examples:
   # Use MQL query directly
   python generate_report.py -c <compartment_id> -n oci_computeagent \\
       --mql "CpuUtilization[1h].groupBy(resourceId).mean()" -o report.html
-        """
+"""
+
+# --interval choices and their length, used to align relative time windows
+_INTERVAL_SECONDS = {'1m': 60, '5m': 300, '15m': 900, '1h': 3600, '6h': 21600, '1d': 86400}
+
+_AUTH_CHOICES = ('config_file', 'instance_principal', 'resource_principal', 'security_token')
+
+
+def _iso8601(value: str) -> datetime:
+    """argparse type for --start-time/--end-time: ISO 8601, naive times taken as UTC."""
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid ISO 8601 time: {value!r}")
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description=_DESCRIPTION,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
 
     # Authentication options
     auth_group = parser.add_argument_group('Authentication')
     auth_group.add_argument(
-        '--auth', choices=['config_file', 'instance_principal', 'resource_principal', 'security_token'],
+        '--auth', choices=_AUTH_CHOICES,
         default=None, help='Authentication method (auto-detected if not specified)'
     )
     auth_group.add_argument(
@@ -111,7 +160,7 @@ Examples:
     )
     query_group.add_argument(
         '-i', '--interval', default='1h',
-        choices=['1m', '5m', '15m', '1h', '6h', '1d'],
+        choices=tuple(_INTERVAL_SECONDS),
         help='Aggregation interval (default: 1h)'
     )
     query_group.add_argument(
@@ -135,28 +184,46 @@ Examples:
         help='Hours of data to fetch (default: 24)'
     )
     time_group.add_argument(
-        '--start-time',
+        '--start-time', type=_iso8601,
         help='Start time (ISO format, e.g., 2024-01-01T00:00:00Z)'
     )
     time_group.add_argument(
-        '--end-time',
+        '--end-time', type=_iso8601,
         help='End time (ISO format, e.g., 2024-01-02T00:00:00Z)'
     )
 
+    # Cache options
+    cache_group = parser.add_argument_group('Cache')
+    cache_group.add_argument(
+        '--no-cache', action='store_true',
+        help=f'Always query OCI; do not read or write the result cache ({CACHE_DIR})'
+    )
+    cache_group.add_argument(
+        '--cache-ttl', type=int, default=3600,
+        help='Seconds a cached query result stays valid (default: 3600); also the '
+             'most an --hours window end is rounded back to reuse cached results'
+    )
+
     # Output options
     output_group = parser.add_argument_group('Output')
     output_group.add_argument(
         '-o', '--output', default='oci_metrics_report.html',
-        help='Output HTML file path (default: oci_metrics_report.html)'
+        help='Output HTML file path (default: oci_metrics_report.html); '
+             'a .gz suffix (e.g. -o report.html.gz) writes gzip-compressed output'
     )
     output_group.add_argument(
         '--title', default='OCI Metrics Report',
         help='Report title'
     )
-    output_group.add_argument(
+    format_group = output_group.add_mutually_exclusive_group()
+    format_group.add_argument(
         '--json', action='store_true',
         help='Output raw JSON instead of HTML'
     )
+    format_group.add_argument(
+        '--ndjson', action='store_true',
+        help='Output newline-delimited JSON (one query result per line) instead of HTML'
+    )
 
     # Discovery options
     discovery_group = parser.add_argument_group('Discovery')
@@ -173,20 +240,44 @@ Examples:
         help='List available compartments and exit'
     )
 
-    return parser.parse_args()
+    args = parser.parse_args()
+    _validate_args(args, parser)
+    return args
 
 
-def get_auth_type(auth_str: Optional[str]) -> Optional[AuthType]:
-    """Convert auth string to AuthType enum."""
-    if auth_str is None:
-        return None
-    mapping = {
+def _validate_args(args: argparse.Namespace, parser: argparse.ArgumentParser) -> None:
+    """Reject invalid argument combinations before any OCI setup happens."""
+    if args.list_metrics and not args.namespace:
+        parser.error("--namespace is required for --list-metrics")
+
+    if args.list_compartments or args.list_namespaces or args.list_metrics:
+        return
+
+    if args.start_time and args.end_time and args.start_time >= args.end_time:
+        parser.error("--start-time must be before --end-time")
+
+    # Report generation
+    if not args.namespace and not args.mql_queries:
+        parser.error("--namespace is required (unless using --mql)")
+    if not args.metrics and not args.mql_queries:
+        parser.error("at least one --metric or --mql is required")
+
+
+@functools.lru_cache(maxsize=None)
+def _auth_map() -> Dict[str, 'AuthType']:
+    """Map --auth choices to AuthType members (built once, on first use)."""
+    from app import AuthType
+    return {
         'config_file': AuthType.CONFIG_FILE,
         'instance_principal': AuthType.INSTANCE_PRINCIPAL,
         'resource_principal': AuthType.RESOURCE_PRINCIPAL,
         'security_token': AuthType.SECURITY_TOKEN
     }
-    return mapping.get(auth_str)
+
+
+def get_auth_type(auth_str: Optional[str]) -> Optional['AuthType']:
+    """Convert auth string to AuthType enum."""
+    return None if auth_str is None else _auth_map().get(auth_str)
 
 
 def build_mql(metric: str, interval: str, statistic: str,
@@ -215,121 +306,204 @@ def build_mql(metric: str, interval: str, statistic: str,
     return mql
 
 
-def generate_html_report(results: List[Dict], title: str, args) -> str:
-    """Generate HTML report from query results."""
-    # Prepare chart data
-    charts_data = []
-    for idx, result in enumerate(results):
-        chart_id = f"chart_{idx}"
-        datasets = []
-
-        for series_idx, series in enumerate(result.get('metric_data', [])):
-            data_points = [
-                {"x": dp['timestamp'], "y": dp['value']}
-                for dp in series.get('data_points', [])
-            ]
-            datasets.append({
-                "label": series.get('label', f"Series {series_idx}"),
-                "data": data_points,
-                "borderColor": get_color(series_idx),
-                "backgroundColor": get_color(series_idx, 0.1),
-                "fill": False,
-                "tension": 0.1
-            })
+def _dumps(obj: Any) -> str:
+    """Serialize report data to a compact JSON string, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str).decode()
+    return json.dumps(obj, default=str)
+
+
+def _dumps_indented(obj: Any) -> bytes:
+    """Serialize data to 2-space indented UTF-8 JSON (the --json output format)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE, default=str)
+    return (json.dumps(obj, indent=2, default=str) + '\n').encode()
+
+
+def _dumps_line(obj: Any) -> bytes:
+    """Serialize one NDJSON record: compact UTF-8 JSON followed by a newline."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE, default=str)
+    return (json.dumps(obj, default=str) + '\n').encode()
+
+
+def _iter_ndjson(f: BinaryIO) -> Iterator[Dict]:
+    """Yield the records of an NDJSON file opened in binary mode, from the start."""
+    loads = orjson.loads if orjson is not None else json.loads
+    f.seek(0)
+    for line in f:
+        yield loads(line)
+
+
+def _output_path(path: str, extension: str) -> str:
+    """Swap a trailing .html (or .html.gz) in the output path for another extension."""
+    if path.endswith('.html.gz'):
+        return path[:-len('.html.gz')] + extension + '.gz'
+    if path.endswith('.html'):
+        return path[:-len('.html')] + extension
+    return path
+
+
+def _open_output(path: str, mode: str):
+    """Open an output file for writing, gzip-compressed if the path ends in .gz.
+
+    Text mode is always UTF-8 (the report declares it, and orjson output is
+    not ASCII-escaped), whatever the locale's default encoding is.
+    """
+    binary = 'b' in mode
+    if path.endswith('.gz'):
+        return gzip.open(path, mode if binary else mode + 't', encoding=None if binary else 'utf-8')
+    return open(path, mode, encoding=None if binary else 'utf-8')
 
-        charts_data.append({
-            "id": chart_id,
-            "query": result.get('query', 'Unknown'),
-            "namespace": result.get('namespace', ''),
-            "datasets": datasets
-        })
 
-    charts_json = json.dumps(charts_data, default=str)
+def cache_key(*parts) -> str:
+    """Build a content-addressed cache key from the query parameters."""
+    return hashlib.sha256(json.dumps(parts, default=str).encode()).hexdigest()
 
-    html = f'''<!DOCTYPE html>
+
+def cache_get(key: str, ttl: int) -> Optional[Dict]:
+    """Return a cached query result, or None if missing, expired or unreadable."""
+    path = os.path.join(CACHE_DIR, f"{key}.json")
+    try:
+        if time.time() - os.path.getmtime(path) > ttl:
+            os.remove(path)
+            return None
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def cache_prune(ttl: int) -> None:
+    """Delete cache entries (and leftover temp files) older than ttl seconds."""
+    cutoff = time.time() - ttl
+    try:
+        with os.scandir(CACHE_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith(('.json', '.tmp')) and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+    except OSError:
+        pass  # Missing directory or a concurrent run already removed the entry
+
+
+def cache_set(key: str, result: Dict) -> None:
+    """Store a query result in the cache (best effort)."""
+    path = os.path.join(CACHE_DIR, f"{key}.json")
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'w') as f:
+            json.dump(result, f, default=str)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"  Warning: could not write cache entry: {e}")
+
+
+# Static parts of the HTML report. The *_TEMPLATE strings are filled with
+# str.format_map(); the CSS and JS are plain text written as-is.
+_HTML_HEAD_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{title}</title>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.1/dist/chart.umd.min.js"></script>
+{head_scripts}    <style>
+'''
+
+_CHART_SCRIPTS = '''    <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.1/dist/chart.umd.min.js"></script>
     <script src="https://cdn.jsdelivr.net/npm/chartjs-adapter-date-fns@3.0.0/dist/chartjs-adapter-date-fns.bundle.min.js"></script>
-    <style>
-        * {{ box-sizing: border-box; margin: 0; padding: 0; }}
-        body {{
+'''
+
+_HTML_CSS = '''        * { box-sizing: border-box; margin: 0; padding: 0; }
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Arial, sans-serif;
             background: #f5f5f5;
             color: #333;
             line-height: 1.6;
-        }}
-        .container {{ max-width: 1400px; margin: 0 auto; padding: 20px; }}
-        header {{
+        }
+        .container { max-width: 1400px; margin: 0 auto; padding: 20px; }
+        header {
             background: linear-gradient(135deg, #312D2A 0%, #4a4541 100%);
             color: white;
             padding: 30px 20px;
             margin-bottom: 30px;
-        }}
-        header h1 {{ font-size: 28px; margin-bottom: 10px; }}
-        header .meta {{ opacity: 0.8; font-size: 14px; }}
-        header .meta span {{ margin-right: 20px; }}
-        .card {{
+        }
+        header h1 { font-size: 28px; margin-bottom: 10px; }
+        header .meta { opacity: 0.8; font-size: 14px; }
+        header .meta span { margin-right: 20px; }
+        .card {
             background: white;
             border-radius: 8px;
             box-shadow: 0 2px 8px rgba(0,0,0,0.1);
             margin-bottom: 24px;
             overflow: hidden;
-        }}
-        .card-header {{
+        }
+        .card-header {
             padding: 16px 20px;
             border-bottom: 1px solid #eee;
             background: #fafafa;
-        }}
-        .card-header h2 {{
+        }
+        .card-header h2 {
             font-size: 16px;
             font-weight: 600;
             color: #333;
-        }}
-        .card-header .namespace {{
+        }
+        .card-header .namespace {
             font-size: 12px;
             color: #666;
             font-family: monospace;
-        }}
-        .card-body {{ padding: 20px; }}
-        .chart-container {{ height: 300px; position: relative; }}
-        .summary {{
+        }
+        .card-body { padding: 20px; }
+        .chart-container { height: 300px; position: relative; }
+        .series-stats {
+            display: flex;
+            flex-wrap: wrap;
+            gap: 4px 20px;
+            font-size: 12px;
+            color: #666;
+            margin-bottom: 12px;
+        }
+        .series-stats .swatch {
+            display: inline-block;
+            width: 10px;
+            height: 10px;
+            border-radius: 2px;
+            margin-right: 6px;
+        }
+        .summary {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 16px;
             margin-bottom: 24px;
-        }}
-        .summary-item {{
+        }
+        .summary-item {
             background: white;
             padding: 20px;
             border-radius: 8px;
             box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }}
-        .summary-item .label {{ font-size: 12px; color: #666; text-transform: uppercase; }}
-        .summary-item .value {{ font-size: 24px; font-weight: 600; color: #312D2A; }}
-        .data-table {{
+        }
+        .summary-item .label { font-size: 12px; color: #666; text-transform: uppercase; }
+        .summary-item .value { font-size: 24px; font-weight: 600; color: #312D2A; }
+        .data-table {
             width: 100%;
             border-collapse: collapse;
             font-size: 13px;
             margin-top: 16px;
-        }}
-        .data-table th, .data-table td {{
+        }
+        .data-table th, .data-table td {
             padding: 10px 12px;
             text-align: left;
             border-bottom: 1px solid #eee;
-        }}
-        .data-table th {{ background: #f9f9f9; font-weight: 600; }}
-        .data-table tr:hover {{ background: #f5f5f5; }}
-        footer {{
+        }
+        .data-table th { background: #f9f9f9; font-weight: 600; }
+        .data-table tr:hover { background: #f5f5f5; }
+        footer {
             text-align: center;
             padding: 20px;
             color: #666;
             font-size: 12px;
-        }}
-        .toggle-table {{
+        }
+        .toggle-table {
             background: #f0f0f0;
             border: none;
             padding: 8px 16px;
@@ -337,41 +511,45 @@ def generate_html_report(results: List[Dict], title: str, args) -> str:
             cursor: pointer;
             font-size: 13px;
             margin-top: 10px;
-        }}
-        .toggle-table:hover {{ background: #e0e0e0; }}
-        .hidden {{ display: none; }}
-        @media print {{
-            header {{ background: #333 !important; -webkit-print-color-adjust: exact; }}
-            .card {{ break-inside: avoid; }}
-            .toggle-table {{ display: none; }}
-        }}
-    </style>
+        }
+        .toggle-table:hover { background: #e0e0e0; }
+        .hidden { display: none; }
+        @media print {
+            header { background: #333 !important; -webkit-print-color-adjust: exact; }
+            .card { break-inside: avoid; }
+            .toggle-table { display: none; }
+        }
+'''
+
+_HTML_HEADER_TEMPLATE = '''    </style>
 </head>
 <body>
     <header>
         <div class="container">
             <h1>{title}</h1>
             <div class="meta">
-                <span>Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</span>
-                <span>Compartment: {args.compartment[:30]}...</span>
-                <span>Time Range: {args.hours} hours</span>
+                <span>Generated: {generated}</span>
+                <span>Compartment: {compartment}...</span>
+                <span>Time Range: {hours} hours</span>
             </div>
         </div>
     </header>
 
-    <main class="container">
+'''
+
+_HTML_BODY_TEMPLATE = '''    <main class="container">
         <div class="summary">
             <div class="summary-item">
                 <div class="label">Total Queries</div>
-                <div class="value">{len(results)}</div>
+                <div class="value">{query_count}</div>
             </div>
             <div class="summary-item">
                 <div class="label">Time Range</div>
-                <div class="value">{args.hours}h</div>
+                <div class="value">{hours}h</div>
             </div>
             <div class="summary-item">
                 <div class="label">Namespace</div>
-                <div class="value">{args.namespace or 'Multiple'}</div>
+                <div class="value">{namespace}</div>
             </div>
         </div>
 
@@ -385,119 +563,243 @@ def generate_html_report(results: List[Dict], title: str, args) -> str:
     </footer>
 
     <script>
-        const chartsData = {charts_json};
-        const colors = [
-            'rgb(49, 45, 42)', 'rgb(40, 167, 69)', 'rgb(220, 53, 69)',
-            'rgb(255, 193, 7)', 'rgb(111, 66, 193)', 'rgb(23, 162, 184)',
-            'rgb(253, 126, 20)', 'rgb(108, 117, 125)'
-        ];
-
-        function initCharts() {{
+        const chartsData = '''
+
+_HTML_TAIL = ''';
+        // Shared by every chart (series colors come with the datasets). Not
+        // frozen: Chart.js normalizes the options object it is given in place
+        const CHART_OPTIONS = {
+            responsive: true,
+            maintainAspectRatio: false,
+            interaction: { mode: 'index', intersect: false },
+            plugins: {
+                legend: { display: true, position: 'top' }
+            },
+            scales: {
+                x: {
+                    type: 'time',
+                    time: { displayFormats: { hour: 'MMM d, HH:mm', day: 'MMM d' } },
+                    title: { display: true, text: 'Time (UTC)' }
+                },
+                y: {
+                    beginAtZero: true,
+                    title: { display: true, text: 'Value' }
+                }
+            }
+        };
+
+        function initCharts() {
             const container = document.getElementById('charts');
 
-            chartsData.forEach((chartData, idx) => {{
+            chartsData.forEach((chartData, idx) => {
                 const card = document.createElement('div');
                 card.className = 'card';
                 card.innerHTML = `
                     <div class="card-header">
-                        <h2>${{chartData.query}}</h2>
-                        <div class="namespace">${{chartData.namespace}}</div>
+                        <h2>${chartData.query}</h2>
+                        <div class="namespace">${chartData.namespace}</div>
                     </div>
                     <div class="card-body">
+                        ${renderStats(chartData)}
                         <div class="chart-container">
-                            <canvas id="${{chartData.id}}"></canvas>
+                            <canvas id="${chartData.id}"></canvas>
                         </div>
-                        <button class="toggle-table" onclick="toggleTable('table_${{idx}}')">
+                        <button class="toggle-table" onclick="toggleTable(${idx})">
                             Show Data Table
                         </button>
-                        <div id="table_${{idx}}" class="hidden">
-                            ${{generateTable(chartData.datasets)}}
-                        </div>
+                        <div id="table_${idx}" class="hidden"></div>
                     </div>
                 `;
                 container.appendChild(card);
 
                 // Create chart
                 const ctx = document.getElementById(chartData.id).getContext('2d');
-                new Chart(ctx, {{
+                new Chart(ctx, {
                     type: 'line',
-                    data: {{ datasets: chartData.datasets }},
-                    options: {{
-                        responsive: true,
-                        maintainAspectRatio: false,
-                        interaction: {{ mode: 'index', intersect: false }},
-                        plugins: {{
-                            legend: {{ display: true, position: 'top' }}
-                        }},
-                        scales: {{
-                            x: {{
-                                type: 'time',
-                                time: {{ displayFormats: {{ hour: 'MMM d, HH:mm', day: 'MMM d' }} }},
-                                title: {{ display: true, text: 'Time (UTC)' }}
-                            }},
-                            y: {{
-                                beginAtZero: true,
-                                title: {{ display: true, text: 'Value' }}
-                            }}
-                        }}
-                    }}
-                }});
-            }});
-        }}
-
-        function generateTable(datasets) {{
-            if (!datasets.length || !datasets[0].data.length) return '<p>No data</p>';
+                    data: { datasets: chartData.datasets },
+                    options: CHART_OPTIONS
+                });
+            });
+        }
+
+        function renderStats(chartData) {
+            const items = chartData.datasets.map((ds, i) => {
+                const st = chartData.stats[i];
+                if (!st) return '';
+                return `<span><span class="swatch" style="background: ${ds.borderColor}"></span>` +
+                    `${ds.label}: min ${st.min.toFixed(2)}, avg ${st.avg.toFixed(2)}, max ${st.max.toFixed(2)}</span>`;
+            }).join('');
+            return items ? `<div class="series-stats">${items}</div>` : '';
+        }
+
+        function generateTable(chartData) {
+            if (!chartData.table.length) return '<p>No data</p>';
 
             let html = '<table class="data-table"><thead><tr><th>Timestamp</th>';
-            datasets.forEach(ds => {{ html += `<th>${{ds.label}}</th>`; }});
+            chartData.datasets.forEach(ds => { html += `<th>${ds.label}</th>`; });
             html += '</tr></thead><tbody>';
 
-            const timestamps = [...new Set(datasets.flatMap(ds => ds.data.map(d => d.x)))].sort();
-            timestamps.forEach(ts => {{
-                html += `<tr><td>${{new Date(ts).toLocaleString()}}</td>`;
-                datasets.forEach(ds => {{
-                    const point = ds.data.find(d => d.x === ts);
-                    html += `<td>${{point ? point.y.toFixed(2) : '-'}}</td>`;
-                }});
+            chartData.table.forEach(([ts, ...values]) => {
+                html += `<tr><td>${new Date(ts).toLocaleString()}</td>`;
+                values.forEach(v => {
+                    html += `<td>${v == null ? '-' : v.toFixed(2)}</td>`;
+                });
                 html += '</tr>';
-            }});
+            });
 
             html += '</tbody></table>';
             return html;
-        }}
-
-        function toggleTable(id) {{
-            const el = document.getElementById(id);
+        }
+
+        function toggleTable(idx) {
+            const el = document.getElementById(`table_${idx}`);
+            // Tables are built on first open rather than for every chart on load
+            if (!el.dataset.rendered) {
+                el.innerHTML = generateTable(chartsData[idx]);
+                el.dataset.rendered = 'true';
+            }
             el.classList.toggle('hidden');
-        }}
+        }
 
         initCharts();
     </script>
 </body>
 </html>'''
 
-    return html
+# Page used instead of the chart report when no query returned any data
+_HTML_ERROR_BODY_TEMPLATE = '''    <main class="container">
+        <div class="card">
+            <div class="card-header">
+                <h2>No data returned</h2>
+            </div>
+            <div class="card-body">
+                <p>None of the {query_count} queries returned any metric data.</p>
+                <table class="data-table">
+                    <thead><tr><th>Query</th><th>Namespace</th><th>Result</th></tr></thead>
+                    <tbody>
+'''
+
+_HTML_ERROR_TAIL = '''                    </tbody>
+                </table>
+            </div>
+        </div>
+    </main>
+
+    <footer>
+        <p>Generated by OCI Metrics Report Generator</p>
+    </footer>
+</body>
+</html>'''
 
 
-def get_color(index: int, alpha: float = 1.0) -> str:
-    """Get color for chart series."""
-    colors = [
-        f"rgba(49, 45, 42, {alpha})",
-        f"rgba(40, 167, 69, {alpha})",
-        f"rgba(220, 53, 69, {alpha})",
-        f"rgba(255, 193, 7, {alpha})",
-        f"rgba(111, 66, 193, {alpha})",
-        f"rgba(23, 162, 184, {alpha})",
-        f"rgba(253, 126, 20, {alpha})",
-        f"rgba(108, 117, 125, {alpha})"
+def _series_stats(values: List[float]) -> Optional[Dict[str, float]]:
+    """Summarize one series' values as min/max/avg, or None if it has no points."""
+    if not values:
+        return None
+    return {"min": min(values), "max": max(values), "avg": sum(values) / len(values)}
+
+
+def _chart_entry(idx: int, result: Dict) -> Dict:
+    """Build the chart data (Chart.js datasets and table rows) for one query result."""
+    datasets = [
+        {
+            "label": series.get('label', f"Series {series_idx}"),
+            # [timestamp, value] pairs; Chart.js reads index 0 as x and 1 as y
+            "data": [[dp['timestamp'], dp['value']] for dp in series.get('data_points', ())],
+            "borderColor": _COLORS_SOLID[series_idx % len(_COLORS_SOLID)],
+            "backgroundColor": _COLORS_FILL[series_idx % len(_COLORS_FILL)],
+            "fill": False,
+            "tension": 0.1
+        }
+        for series_idx, series in enumerate(result.get('metric_data', ()))
     ]
-    return colors[index % len(colors)]
+
+    # Data table rows: [timestamp, value per series...], one per distinct
+    # timestamp, so the page doesn't have to search every series per cell
+    n_series = len(datasets)
+    ts_index = {}
+    for series_idx, dataset in enumerate(datasets):
+        for ts, value in dataset['data']:
+            row = ts_index.get(ts)
+            if row is None:
+                row = ts_index[ts] = [None] * n_series
+            row[series_idx] = value
+
+    return {
+        "id": f"chart_{idx}",
+        "query": result.get('query', 'Unknown'),
+        "namespace": result.get('namespace', ''),
+        "datasets": datasets,
+        # Per-series summary, aligned with datasets (kept off the Chart.js datasets)
+        "stats": [_series_stats([value for _, value in dataset['data']]) for dataset in datasets],
+        "table": [[ts, *values] for ts, values in sorted(ts_index.items())]
+    }
+
+
+def _page_fields(title: str, args, query_count: int, head_scripts: str) -> Dict[str, Any]:
+    """Compute the template fields shared by the report and error pages, once."""
+    return {
+        "title": title,
+        "generated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "compartment": args.compartment[:30],
+        "hours": args.hours,
+        "query_count": query_count,
+        "namespace": args.namespace or 'Multiple',
+        "head_scripts": head_scripts,
+    }
+
+
+def _write_page_header(f: TextIO, fields: Dict[str, Any]) -> None:
+    """Write the document head, styles and page header common to both pages."""
+    f.write(_HTML_HEAD_TEMPLATE.format_map(fields))
+    f.write(_HTML_CSS)
+    f.write(_HTML_HEADER_TEMPLATE.format_map(fields))
+
+
+def write_html_report(f: TextIO, results: Iterable[Dict], title: str, args,
+                      query_count: int) -> None:
+    """Write the HTML report for query results to an open text file.
+
+    The page is written in pieces (head, one chart's JSON at a time, tail),
+    so neither the document nor the full chart data is ever held in memory;
+    results can be any iterable, e.g. records read back from an NDJSON spool.
+    """
+    fields = _page_fields(title, args, query_count, head_scripts=_CHART_SCRIPTS)
+    _write_page_header(f, fields)
+    f.write(_HTML_BODY_TEMPLATE.format_map(fields))
+    f.write('[')
+    for idx, result in enumerate(results):
+        if idx:
+            f.write(',')
+        f.write(_dumps(_chart_entry(idx, result)))
+    f.write(']')
+    f.write(_HTML_TAIL)
+
+
+def write_error_page(f: TextIO, results: Iterable[Dict], title: str, args,
+                     query_count: int) -> None:
+    """Write a small report page listing each query's error, for runs with no data.
+
+    Unlike the full report it embeds no chart data and loads no Chart.js.
+    """
+    fields = _page_fields(title, args, query_count, head_scripts='')
+    _write_page_header(f, fields)
+    f.write(_HTML_ERROR_BODY_TEMPLATE.format_map(fields))
+    for result in results:
+        f.write(
+            f"                        <tr><td>{html.escape(result.get('query', 'Unknown'))}</td>"
+            f"<td>{html.escape(result.get('namespace') or '')}</td>"
+            f"<td>{html.escape(result.get('error', 'No data'))}</td></tr>\n"
+        )
+    f.write(_HTML_ERROR_TAIL)
 
 
 def main():
     """Main entry point."""
     args = parse_args()
 
+    from app import OCIMonitoringClient
+
     # Initialize OCI client
     print(f"Initializing OCI client...")
     try:
@@ -521,8 +823,8 @@ def main():
         print("-" * 60)
         compartments = client.list_compartments()
         for comp in compartments:
-            print(f"  {comp['path']}")
-            print(f"    OCID: {comp['id']}")
+            print(f"  {comp.path}")
+            print(f"    OCID: {comp.id}")
         sys.exit(0)
 
     if args.list_namespaces:
@@ -534,36 +836,28 @@ def main():
         sys.exit(0)
 
     if args.list_metrics:
-        if not args.namespace:
-            print("Error: --namespace is required for --list-metrics")
-            sys.exit(1)
         print(f"\nMetrics in namespace '{args.namespace}':")
         print("-" * 60)
         metrics = client.list_metrics(args.compartment, args.namespace)
         for metric in metrics:
-            dims = ", ".join(metric['dimensions']) if metric['dimensions'] else "none"
-            print(f"  {metric['name']}")
+            dims = ", ".join(metric.dimensions) if metric.dimensions else "none"
+            print(f"  {metric.name}")
             print(f"    Dimensions: {dims}")
         sys.exit(0)
 
-    # Validate required arguments for report generation
-    if not args.namespace and not args.mql_queries:
-        print("Error: --namespace is required (unless using --mql)")
-        sys.exit(1)
-
-    if not args.metrics and not args.mql_queries:
-        print("Error: At least one --metric or --mql is required")
-        sys.exit(1)
-
     # Calculate time range
     if args.start_time and args.end_time:
-        start_time = datetime.fromisoformat(args.start_time.replace('Z', '+00:00'))
-        end_time = datetime.fromisoformat(args.end_time.replace('Z', '+00:00'))
+        start_time, end_time = args.start_time, args.end_time
     else:
-        end_time = datetime.utcnow()
+        # End on a boundary of the aggregation interval so re-runs share cache
+        # keys; capped at the cache TTL, the staleness the cache already allows
+        step = 60 if args.no_cache else max(60, min(_INTERVAL_SECONDS[args.interval], args.cache_ttl))
+        now = datetime.now(timezone.utc).timestamp()
+        end_time = datetime.fromtimestamp(now // step * step, timezone.utc)
         start_time = end_time - timedelta(hours=args.hours)
+    start_iso, end_iso = start_time.isoformat(), end_time.isoformat()
 
-    print(f"\nTime range: {start_time.isoformat()} to {end_time.isoformat()}")
+    print(f"\nTime range: {start_iso} to {end_iso}")
 
     # Build queries
     queries = []
@@ -591,47 +885,93 @@ def main():
                 'mql': mql
             })
 
-    # Execute queries
-    results = []
+    # Execute queries concurrently (each is an independent network round-trip);
+    # results are collected and reported in submission order
     print(f"\nExecuting {len(queries)} queries...")
 
-    for idx, query in enumerate(queries):
-        print(f"  [{idx + 1}/{len(queries)}] {query['mql']}")
-        try:
-            result = client.query_metrics(
-                compartment_id=args.compartment,
-                namespace=query['namespace'],
-                query=query['mql'],
-                start_time=start_time,
-                end_time=end_time
-            )
-            results.append(result)
-            data_points = sum(len(s['data_points']) for s in result.get('metric_data', []))
-            print(f"           -> {len(result.get('metric_data', []))} series, {data_points} data points")
-        except Exception as e:
-            print(f"           -> Error: {e}")
-            results.append({
-                'query': query['mql'],
-                'namespace': query['namespace'],
-                'error': str(e),
-                'metric_data': []
-            })
-
-    # Generate output
-    if args.json:
-        output = json.dumps(results, indent=2, default=str)
-        output_file = args.output.replace('.html', '.json') if args.output.endswith('.html') else args.output
+    # SummarizeMetricsData takes a single MQL expression per call, so queries
+    # cannot be batched; identical ones (e.g. -m X plus an equivalent --mql)
+    # are only sent once and share the result
+    unique_queries = list(dict.fromkeys((q['namespace'], q['mql']) for q in queries))
+
+    if not args.no_cache:
+        cache_prune(args.cache_ttl)
+
+    def run_query(namespace: str, mql: str) -> Dict:
+        key = cache_key(client.config.get('region'), args.compartment, namespace, mql,
+                        start_iso, end_iso)
+        if not args.no_cache:
+            cached = cache_get(key, args.cache_ttl)
+            if cached is not None:
+                return cached
+
+        result = client.query_metrics(
+            compartment_id=args.compartment,
+            namespace=namespace,
+            query=mql,
+            start_time=start_time,
+            end_time=end_time
+        )
+        if not args.no_cache:
+            cache_set(key, result)
+        return result
+
+    # Each result is spooled to disk as an NDJSON line as soon as it has been
+    # reported, and dropped, so a large run doesn't keep every query's data in
+    # memory until the report is written; with --ndjson the spool is the output
+    if args.ndjson:
+        output_file = _output_path(args.output, '.ndjson')
+        spool = _open_output(output_file, 'wb')
     else:
-        output = generate_html_report(results, args.title, args)
-        output_file = args.output
-
-    # Write output
-    with open(output_file, 'w') as f:
-        f.write(output)
+        spool = tempfile.TemporaryFile()
+    successful = 0
+    has_data = False
+
+    with spool:
+        with ThreadPoolExecutor(max_workers=min(MAX_QUERY_WORKERS, len(unique_queries))) as pool:
+            futures_by_query = {
+                (namespace, mql): pool.submit(run_query, namespace, mql)
+                for namespace, mql in unique_queries
+            }
+            futures = [futures_by_query[(q['namespace'], q['mql'])] for q in queries]
+            del futures_by_query
+
+            for idx, query in enumerate(queries):
+                future, futures[idx] = futures[idx], None
+                print(f"  [{idx + 1}/{len(queries)}] {query['mql']}")
+                try:
+                    result = future.result()
+                    successful += 1
+                    has_data = has_data or bool(result.get('metric_data'))
+                    data_points = sum(len(s['data_points']) for s in result.get('metric_data', []))
+                    print(f"           -> {len(result.get('metric_data', []))} series, {data_points} data points")
+                except Exception as e:
+                    print(f"           -> Error: {e}")
+                    result = {
+                        'query': query['mql'],
+                        'namespace': query['namespace'],
+                        'error': str(e),
+                        'metric_data': []
+                    }
+                spool.write(_dumps_line(result))
+
+        # Write output
+        if args.json:
+            output_file = _output_path(args.output, '.json')
+            with _open_output(output_file, 'wb') as f:
+                f.write(_dumps_indented(list(_iter_ndjson(spool))))
+        elif not args.ndjson:
+            output_file = args.output
+            with _open_output(output_file, 'w') as f:
+                if has_data:
+                    write_html_report(f, _iter_ndjson(spool), args.title, args, len(queries))
+                else:
+                    print("\nNo query returned data; writing an error summary instead of charts")
+                    write_error_page(f, _iter_ndjson(spool), args.title, args, len(queries))
 
     print(f"\nReport generated: {output_file}")
-    print(f"  Total queries: {len(results)}")
-    print(f"  Successful: {sum(1 for r in results if 'error' not in r)}")
+    print(f"  Total queries: {len(queries)}")
+    print(f"  Successful: {successful}")
 
     # Print file size
     file_size = os.path.getsize(output_file)
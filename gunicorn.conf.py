@@ -0,0 +1,33 @@
+"""
+Gunicorn configuration for the OCI Metrics Report Generator.
+
+Usage:
+    gunicorn -c gunicorn.conf.py app:app
+
+The backend spends nearly all of its time waiting on OCI HTTPS calls, so
+concurrency comes from threads rather than processes: one worker's threads
+keep many OCI requests in flight at once.
+
+The app keeps state in-process (OCI clients, discovery caches, compartment
+names, and what /api/cache/invalidate clears), so it defaults to a single
+worker. With GUNICORN_WORKERS > 1 each worker has its own copy: compartment
+names may show as OCIDs and cache invalidation only reaches one worker.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8080')}"
+
+workers = int(os.environ.get("GUNICORN_WORKERS", "1"))
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", "16"))
+
+keepalive = 5
+# Unified queries across many regions/compartments can take a while
+timeout = 120
+
+
+def post_worker_init(worker):
+    """Build the default-region OCI client before the first request arrives."""
+    from app import warm_up_clients
+    warm_up_clients()
@@ -29,8 +29,8 @@ if [ ! -f ~/.oci/config ]; then
 fi
 
 # Start the application
-echo -e "${GREEN}Starting server on http://localhost:8080${NC}"
+echo -e "${GREEN}Starting server on http://localhost:${PORT:-8080}${NC}"
 echo -e "Press Ctrl+C to stop the server"
 echo ""
 
-python app.py
+exec gunicorn -c gunicorn.conf.py app:app